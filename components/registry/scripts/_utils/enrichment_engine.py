@@ -10,6 +10,7 @@ from typing import Any, Protocol, cast
 
 import requests
 
+from .http import CacheConfig
 from .metrics import Bucket, ensure_bucket
 
 
@@ -120,6 +121,7 @@ class EnricherContext:
     limiter: ServiceLimiter
     session_getter: Callable[[], requests.Session]
     timeout_s: float
+    cache: CacheConfig | None = None
 
     def request_json(
         self,
@@ -131,12 +133,16 @@ class EnricherContext:
     ) -> Any:
         self.limiter.acquire()
         session = self.session_getter()
+        kwargs: dict[str, Any] = {}
+        if self.cache is not None:
+            kwargs["cache"] = self.cache
         return fetcher(
             session=session,
             url=url,
             headers=headers,
             timeout_s=self.timeout_s,
             retry=retry_cfg,
+            **kwargs,
         )
 
 
@@ -156,6 +162,7 @@ def run_enrichment_engine(
     workers: int,
     run_fetched_at: str,
     progress_every: int | None = None,
+    cache_by_service: dict[str, CacheConfig] | None = None,
 ) -> EngineRunResult:
     enricher_list = list(enrichers)
     stats: dict[str, ServiceStats] = {e.name: ServiceStats() for e in enricher_list}
@@ -182,6 +189,7 @@ def run_enrichment_engine(
                 limiter=limiter,
                 session_getter=session_factory,
                 timeout_s=timeout_s,
+                cache=(cache_by_service or {}).get(enricher.name),
             )
             try:
                 return enricher.fetch(key, ctx)
@@ -1,11 +1,50 @@
 from __future__ import annotations
 
+import functools
 import os
 from collections.abc import Iterable
 
 DEFAULT_GITHUB_TOKEN_ENVS: tuple[str, ...] = ("GH_TOKEN", "GH_API_TOKEN", "GITHUB_TOKEN")
 
 
+@functools.lru_cache(maxsize=16)
+def _resolve_order(preferred_env: str, extra_envs: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the de-duplicated env var lookup order for `get_github_token`."""
+    order: list[str] = []
+    seen: set[str] = set()
+    for k in (preferred_env, *extra_envs, *DEFAULT_GITHUB_TOKEN_ENVS):
+        if not isinstance(k, str):
+            continue
+        k = k.strip()
+        if k and k not in seen:
+            seen.add(k)
+            order.append(k)
+    return tuple(order)
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_order_bytes(preferred_env: str, extra_envs: tuple[str, ...]) -> tuple[bytes, ...]:
+    return tuple(os.fsencode(k) for k in _resolve_order(preferred_env, extra_envs))
+
+
+def _any_nonempty_env(names: tuple[bytes, ...]) -> bool:
+    """Return True if any of `names` is set to a non-blank value.
+
+    Only values that are present get decoded, and they are stripped with `str.strip()` so
+    Unicode whitespace counts as blank exactly as it does in `get_github_token`.
+    """
+    for n in names:
+        v = os.environb.get(n)
+        if v and os.fsdecode(v).strip():
+            return True
+    return False
+
+
+def _extra_envs_key(extra_envs: Iterable[str]) -> tuple[str, ...]:
+    # Drop non-str entries before they reach the lru_cache key (which must be hashable).
+    return tuple(k for k in extra_envs if isinstance(k, str))
+
+
 def get_github_token(
     *, preferred_env: str = "GH_TOKEN", extra_envs: Iterable[str] = ()
 ) -> str | None:
@@ -16,18 +55,7 @@ def get_github_token(
     - extra_envs (in order)
     - DEFAULT_GITHUB_TOKEN_ENVS (in order)
     """
-
-    candidates: list[str] = []
-    if preferred_env and preferred_env.strip():
-        candidates.append(preferred_env.strip())
-    for k in extra_envs:
-        if isinstance(k, str) and k.strip():
-            candidates.append(k.strip())
-    for k in DEFAULT_GITHUB_TOKEN_ENVS:
-        if k not in candidates:
-            candidates.append(k)
-
-    for k in candidates:
+    for k in _resolve_order(preferred_env or "", _extra_envs_key(extra_envs)):
         v = os.environ.get(k)
         if isinstance(v, str):
             v = v.strip()
@@ -37,4 +65,8 @@ def get_github_token(
 
 
 def has_github_token(*, preferred_env: str = "GH_TOKEN", extra_envs: Iterable[str] = ()) -> bool:
-    return get_github_token(preferred_env=preferred_env, extra_envs=extra_envs) is not None
+    """Return True if `get_github_token` would find a token (same resolution order)."""
+    if not os.supports_bytes_environ:
+        # No `os.environb` (e.g. Windows); use the str path.
+        return get_github_token(preferred_env=preferred_env, extra_envs=extra_envs) is not None
+    return _any_nonempty_env(_resolve_order_bytes(preferred_env or "", _extra_envs_key(extra_envs)))
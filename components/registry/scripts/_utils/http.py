@@ -1,11 +1,72 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import random
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import reduce
+from importlib.util import find_spec
+from operator import or_
+from pathlib import Path
+from typing import Any, Protocol
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # Optional: concurrent (HTTP/2 with `httpx[http2]`) fetches in `fetch_json_many`.
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+try:  # Optional: parses response bytes directly, skipping the decode-to-str step.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+from .io import dump_json_atomic, load_json
+
+_NETWORK_ERRORS: tuple[type[BaseException], ...] = (requests.RequestException,)
+if httpx is not None:
+    _NETWORK_ERRORS = (*_NETWORK_ERRORS, httpx.RequestError)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Only advertise Brotli when a decoder is installed; urllib3/httpx can't decode it otherwise.
+_ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if any(find_spec(m) is not None for m in ("brotli", "brotlicffi"))
+    else "gzip, deflate"
+)
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_default_session() -> requests.Session:
+    """Return a lazily-created, module-wide `requests.Session` with a tuned connection pool.
+
+    Reusing one session keeps connections alive across calls, avoiding a TCP + TLS handshake
+    per request. Callers that need per-thread isolation should keep passing their own session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers["Connection"] = "keep-alive"
+                s.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+                _SESSION = s
+    return _SESSION
 
 
 def _maybe_int(s: str | None) -> int | None:
@@ -17,24 +78,57 @@ def _maybe_int(s: str | None) -> int | None:
         return None
 
 
-def _retry_after_seconds(headers: dict[str, str] | None) -> int | None:
+def _retry_after_seconds(headers: Mapping[str, str] | None) -> int | None:
+    """Parse Retry-After as delay-seconds or an RFC 7231 HTTP-date (seconds from now)."""
     if not headers:
         return None
-    return _maybe_int(_get_header(headers, "Retry-After"))
+    raw = _get_header(headers, "Retry-After")
+    seconds = _maybe_int(raw)
+    if seconds is not None or not isinstance(raw, str):
+        return seconds
+    try:
+        dt = parsedate_to_datetime(raw.strip())
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        # HTTP-dates are always GMT; parsedate_to_datetime returns naive for "-0000".
+        dt = dt.replace(tzinfo=UTC)
+    return max(0, int((dt - datetime.now(UTC)).total_seconds()))
 
 
-def _get_header(headers: dict[str, str] | None, name: str) -> str | None:
-    if not headers:
+def _get_header(headers: Mapping[str, str] | None, name: str) -> str | None:
+    if headers is None:
         return None
-    # Requests' headers are case-insensitive, but we sometimes convert to a plain dict.
-    target = name.strip().lower()
+    # Response mappings (requests' CaseInsensitiveDict, httpx.Headers) aren't dict subclasses
+    # and look names up case-insensitively in O(1).
+    if not isinstance(headers, dict):
+        return headers.get(name)
+    # Plain dicts (e.g. FetchJsonResult.headers) are case-sensitive; fall back to a scan.
+    value = headers.get(name)
+    if value is not None:
+        return value
+    target = name.lower()
     for k, v in headers.items():
-        if isinstance(k, str) and k.strip().lower() == target:
+        if isinstance(k, str) and k.lower() == target:
             return v
     return None
 
 
-def _rate_limit_reset_wait_s(headers: dict[str, str] | None) -> int | None:
+# Response headers that callers never read; dropped to keep aggregated results compact.
+# The cache reads validators (ETag / Last-Modified) from the raw response before this filter.
+_DROPPED_RESULT_HEADERS = frozenset(
+    {"etag", "last-modified", "server", "via", "x-github-request-id"}
+)
+
+
+def _result_headers(headers: Mapping[str, str] | None) -> dict[str, str] | None:
+    if headers is None:
+        return None
+    kept = {k: v for k, v in headers.items() if k.lower() not in _DROPPED_RESULT_HEADERS}
+    return kept or None
+
+
+def _rate_limit_reset_wait_s(headers: Mapping[str, str] | None) -> int | None:
     """Best-effort wait time derived from common rate limit headers.
 
     GitHub uses:
@@ -59,6 +153,15 @@ class RetryConfig:
     backoff_base_s: float = 0.5
     backoff_cap_s: float = 60.0
     retry_statuses: tuple[int, ...] = (403, 429, 500, 502, 503, 504)
+    # Bitset of retry_statuses so the per-response check is a shift instead of a tuple scan.
+    _retry_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = reduce(or_, (1 << s for s in self.retry_statuses if s >= 0), 0)
+        object.__setattr__(self, "_retry_mask", mask)
+
+    def should_retry_status(self, status: int) -> bool:
+        return status >= 0 and bool((self._retry_mask >> status) & 1)
 
 
 @dataclass(frozen=True)
@@ -70,28 +173,127 @@ class FetchJsonResult:
     error: str | None
     attempts: int
     last_retry_after_s: int | None = None
+    from_cache: bool = False
 
 
-def fetch_json(
+@dataclass(frozen=True)
+class CacheConfig:
+    """On-disk conditional GET cache (ETag / Last-Modified), keyed by URL."""
+
+    dir: Path
+    enabled: bool = True
+
+
+def _cache_entry_path(cache: CacheConfig, url: str) -> Path:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache.dir / f"{key}.json"
+
+
+def _load_cache_entry(cache: CacheConfig | None, url: str) -> dict[str, Any] | None:
+    if cache is None or not cache.enabled:
+        return None
+    path = _cache_entry_path(cache, url)
+    try:
+        entry = load_json(path)
+    except Exception:
+        return None
+    if not isinstance(entry, dict) or "data" not in entry:
+        return None
+    if not isinstance(entry.get("etag"), str) and not isinstance(entry.get("last_modified"), str):
+        return None
+    return entry
+
+
+def _store_cache_entry(cache: CacheConfig | None, url: str, *, headers: Any, data: Any) -> None:
+    if cache is None or not cache.enabled:
+        return
+    etag = _get_header(headers, "ETag")
+    last_modified = _get_header(headers, "Last-Modified")
+    if not etag and not last_modified:
+        return
+    entry = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "headers": _result_headers(headers),
+        "data": data,
+    }
+    # The cache is an optimization: skip fsync (a lost entry only means a refetch) and never
+    # fail a fetch because it couldn't be written.
+    with suppress(Exception):
+        dump_json_atomic(_cache_entry_path(cache, url), entry, fsync=False)
+
+
+def _cached_result_headers(
+    entry: dict[str, Any], headers: Mapping[str, str] | None
+) -> dict[str, str] | None:
+    # A 304 usually omits headers callers rely on (e.g. GitHub's Link for pagination), so
+    # start from the headers stored with the cached body and overlay the fresh ones.
+    stored = entry.get("headers")
+    merged = dict(stored) if isinstance(stored, dict) else {}
+    merged.update(_result_headers(headers) or {})
+    return merged or None
+
+
+def _conditional_headers(
+    headers: dict[str, str] | None, entry: dict[str, Any] | None
+) -> dict[str, str] | None:
+    if entry is None:
+        return headers
+    merged = dict(headers or {})
+    if isinstance(entry.get("etag"), str):
+        merged["If-None-Match"] = entry["etag"]
+    if isinstance(entry.get("last_modified"), str):
+        merged["If-Modified-Since"] = entry["last_modified"]
+    return merged
+
+
+class HttpClient(Protocol):
+    """Minimal client interface shared by `requests.Session` and `httpx.Client`.
+
+    `follow_redirects` is only passed to httpx clients; `requests` follows redirects by default.
+    """
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        timeout: float,
+        follow_redirects: bool = ...,
+    ) -> Any: ...
+
+
+@dataclass(frozen=True)
+class _Sleep:
+    seconds: float
+
+
+# Steps yielded by `_fetch_json_steps`: either request headers for the next GET, or a sleep.
+_Step = dict[str, str] | None | _Sleep
+
+
+def _fetch_json_steps(
     *,
-    session: requests.Session,
     url: str,
     headers: dict[str, str] | None,
-    timeout_s: float,
     retry: RetryConfig,
-) -> FetchJsonResult:
-    """GET a URL and parse JSON with retry/backoff.
+    cache: CacheConfig | None,
+) -> Generator[_Step, Any, FetchJsonResult]:
+    """Transport-agnostic retry/backoff loop behind `fetch_json` and `fetch_json_many`.
 
-    Retries on retry_statuses and on request-level exceptions.
-    Honors integer Retry-After when present. Also honors common rate-limit reset headers
-    (e.g., GitHub's X-RateLimit-Reset) when present.
+    Yields request headers when a GET should be issued (the driver sends back the response,
+    or throws the network error into the generator) and `_Sleep` when it should back off.
     """
     last_retry_after: int | None = None
+    cached = _load_cache_entry(cache, url)
+    headers = {"Accept-Encoding": _ACCEPT_ENCODING, **(headers or {})}
+    # Decorrelated jitter: each wait is drawn from [base, 3 * previous wait], capped.
+    prev_wait = retry.backoff_base_s
 
     for attempt in range(1, max(1, retry.max_attempts) + 1):
         try:
-            resp = session.get(url, headers=headers, timeout=timeout_s)
-        except requests.RequestException as e:
+            resp = yield _conditional_headers(headers, cached)
+        except _NETWORK_ERRORS as e:
             # Retryable network error.
             if attempt >= retry.max_attempts:
                 return FetchJsonResult(
@@ -103,34 +305,58 @@ def fetch_json(
                     attempts=attempt,
                     last_retry_after_s=last_retry_after,
                 )
-            wait_s = min(retry.backoff_cap_s, (2**attempt) * retry.backoff_base_s)
-            wait_s = wait_s + random.random() * 0.25
-            time.sleep(wait_s)
+            wait_s = min(retry.backoff_cap_s, random.uniform(retry.backoff_base_s, prev_wait * 3.0))
+            prev_wait = wait_s
+            yield _Sleep(wait_s)
             continue
 
         status = int(resp.status_code)
-        # Success path.
-        if 200 <= status < 300:
-            try:
+        # Conditional hit: the server confirmed our cached body is still current.
+        if status == 304:
+            if cached is not None:
                 return FetchJsonResult(
                     ok=True,
                     status=status,
-                    data=resp.json(),
-                    headers=dict(resp.headers) if resp.headers else None,
+                    data=cached["data"],
+                    headers=_cached_result_headers(cached, resp.headers),
                     error=None,
                     attempts=attempt,
                     last_retry_after_s=last_retry_after,
+                    from_cache=True,
                 )
+            if attempt < retry.max_attempts:
+                # No usable cache entry (e.g. caller-supplied validators); refetch unconditionally.
+                headers = {
+                    k: v
+                    for k, v in (headers or {}).items()
+                    if k.lower() not in ("if-none-match", "if-modified-since")
+                }
+                continue
+
+        # Success path.
+        if 200 <= status < 300:
+            try:
+                data = _json_loads(resp.content)
             except Exception as e:
                 return FetchJsonResult(
                     ok=False,
                     status=status,
                     data=None,
-                    headers=dict(resp.headers) if resp.headers else None,
+                    headers=_result_headers(resp.headers),
                     error=f"Invalid JSON payload: {e}",
                     attempts=attempt,
                     last_retry_after_s=last_retry_after,
                 )
+            _store_cache_entry(cache, url, headers=resp.headers, data=data)
+            return FetchJsonResult(
+                ok=True,
+                status=status,
+                data=data,
+                headers=_result_headers(resp.headers),
+                error=None,
+                attempts=attempt,
+                last_retry_after_s=last_retry_after,
+            )
 
         # Non-success: decide whether to retry.
         body = None
@@ -139,32 +365,31 @@ def fetch_json(
         except Exception:
             body = None
 
-        if status in retry.retry_statuses and attempt < retry.max_attempts:
-            hdrs = dict(resp.headers) if resp.headers else None
-            ra = _retry_after_seconds(hdrs)
+        if retry.should_retry_status(status) and attempt < retry.max_attempts:
+            ra = _retry_after_seconds(resp.headers)
             if isinstance(ra, int):
                 last_retry_after = ra
-            rl_wait = _rate_limit_reset_wait_s(hdrs)
-            wait_s = min(retry.backoff_cap_s, (2**attempt) * retry.backoff_base_s)
+            rl_wait = _rate_limit_reset_wait_s(resp.headers)
+            wait_s = min(retry.backoff_cap_s, random.uniform(retry.backoff_base_s, prev_wait * 3.0))
+            prev_wait = wait_s
             if isinstance(ra, int):
                 wait_s = max(wait_s, float(ra))
             if isinstance(rl_wait, int):
                 # Rate-limit reset can legitimately exceed backoff cap; honor it.
                 wait_s = max(wait_s, float(rl_wait))
-            wait_s = wait_s + random.random() * 0.25
-            time.sleep(wait_s)
+            yield _Sleep(wait_s)
             continue
 
         # Final failure.
         msg = f"HTTP {status}"
         if body:
             msg = f"{msg}: {body[:5000]}"
-        ra = _retry_after_seconds(dict(resp.headers) if resp.headers else None)
+        ra = _retry_after_seconds(resp.headers)
         return FetchJsonResult(
             ok=False,
             status=status,
             data=None,
-            headers=dict(resp.headers) if resp.headers else None,
+            headers=_result_headers(resp.headers),
             error=msg + (f" (Retry-After={ra}s)" if isinstance(ra, int) else ""),
             attempts=attempt,
             last_retry_after_s=ra if isinstance(ra, int) else last_retry_after,
@@ -180,3 +405,267 @@ def fetch_json(
         attempts=retry.max_attempts,
         last_retry_after_s=last_retry_after,
     )
+
+
+def fetch_json(
+    *,
+    session: HttpClient,
+    url: str,
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None = None,
+) -> FetchJsonResult:
+    """GET a URL and parse JSON with retry/backoff.
+
+    Retries on retry_statuses and on request-level exceptions.
+    Honors Retry-After (delay-seconds or HTTP-date) when present. Also honors common
+    rate-limit reset headers (e.g., GitHub's X-RateLimit-Reset) when present.
+
+    When `cache` is enabled, previously seen ETag / Last-Modified validators are sent as
+    If-None-Match / If-Modified-Since, and a 304 response returns the cached body with
+    `from_cache=True`.
+    """
+    # httpx doesn't follow redirects by default; match `requests` (e.g. GitHub 301s).
+    get_kwargs: dict[str, Any] = {}
+    if httpx is not None and isinstance(session, httpx.Client):
+        get_kwargs["follow_redirects"] = True
+    steps = _fetch_json_steps(url=url, headers=headers, retry=retry, cache=cache)
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, _Sleep):
+                time.sleep(step.seconds)
+                step = steps.send(None)
+                continue
+            try:
+                resp = session.get(url, headers=step, timeout=timeout_s, **get_kwargs)
+            except _NETWORK_ERRORS as e:
+                step = steps.throw(e)
+                continue
+            step = steps.send(resp)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    """Build the `httpx.AsyncClient` `fetch_json_many` uses when no client is given.
+
+    HTTP/2 is enabled only when `h2` is installed (plain `pip install httpx` lacks it).
+    """
+    return httpx.AsyncClient(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        follow_redirects=True,
+    )
+
+
+def _advance(
+    steps: Generator[_Step, Any, FetchJsonResult], value: Any, exc: BaseException | None = None
+) -> tuple[bool, Any]:
+    """Resume `steps` once; return `(True, result)` when it finishes, else `(False, step)`.
+
+    StopIteration can't propagate through an asyncio future, so it is unwrapped here.
+    """
+    try:
+        step = steps.throw(exc) if exc is not None else steps.send(value)
+    except StopIteration as stop:
+        return True, stop.value
+    return False, step
+
+
+async def _fetch_json_async(
+    *,
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None,
+) -> FetchJsonResult:
+    steps = _fetch_json_steps(url=url, headers=headers, retry=retry, cache=cache)
+    # Steps that touch disk or parse JSON (the initial cache read, and handling a 2xx body,
+    # which may write the cache) run in a worker thread so they don't block other in-flight
+    # requests. Everything else is cheap and stays on the event loop.
+    if cache is not None and cache.enabled:
+        done, value = await asyncio.to_thread(_advance, steps, None)
+    else:
+        done, value = _advance(steps, None)
+    while not done:
+        if isinstance(value, _Sleep):
+            await asyncio.sleep(value.seconds)
+            done, value = _advance(steps, None)
+            continue
+        try:
+            # Match `requests`, which follows redirects (e.g. GitHub 301s for renamed repos).
+            resp = await client.get(url, headers=value, timeout=timeout_s, follow_redirects=True)
+        except _NETWORK_ERRORS as e:
+            done, value = _advance(steps, None, e)
+            continue
+        if 200 <= int(resp.status_code) < 300:
+            done, value = await asyncio.to_thread(_advance, steps, resp)
+        else:
+            done, value = _advance(steps, resp)
+    return value
+
+
+async def fetch_json_many_async(
+    *,
+    client: httpx.AsyncClient,
+    urls: Iterable[str],
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None = None,
+) -> list[FetchJsonResult]:
+    """Fetch several JSON URLs concurrently on `client`, in the same order as `urls`.
+
+    The caller's client is used as-is (headers, auth, proxies, transport, HTTP/2, ...), so
+    with `http2=True` the requests multiplex onto one connection per host. Each URL gets the
+    same retry/backoff handling as `fetch_json`.
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                _fetch_json_async(
+                    client=client,
+                    url=url,
+                    headers=headers,
+                    timeout_s=timeout_s,
+                    retry=retry,
+                    cache=cache,
+                )
+                for url in urls
+            )
+        )
+    )
+
+
+async def _fetch_json_many_new_client(
+    *,
+    urls: list[str],
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None,
+) -> list[FetchJsonResult]:
+    async with _new_async_client() as client:
+        return await fetch_json_many_async(
+            client=client,
+            urls=urls,
+            headers=headers,
+            timeout_s=timeout_s,
+            retry=retry,
+            cache=cache,
+        )
+
+
+async def _fetch_json_many_threaded(
+    *,
+    client: HttpClient,
+    urls: list[str],
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None,
+) -> list[FetchJsonResult]:
+    # httpx.Client is thread-safe, so each URL runs `fetch_json` on the caller's client in a
+    # worker thread; with `http2=True` the concurrent requests share one connection per host.
+    sem = asyncio.Semaphore(8)
+
+    async def _one(url: str) -> FetchJsonResult:
+        async with sem:
+            return await asyncio.to_thread(
+                fetch_json,
+                session=client,
+                url=url,
+                headers=headers,
+                timeout_s=timeout_s,
+                retry=retry,
+                cache=cache,
+            )
+
+    return list(await asyncio.gather(*(_one(url) for url in urls)))
+
+
+def _has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def fetch_json_many(
+    *,
+    client: HttpClient | None = None,
+    urls: Iterable[str],
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None = None,
+) -> list[FetchJsonResult]:
+    """Fetch several JSON URLs, returning results in the same order as `urls`.
+
+    Requests run concurrently (via `asyncio.gather`) when httpx is installed and no event
+    loop is already running in this thread:
+    - `client=None`: on a short-lived `httpx.AsyncClient` (HTTP/2 when `h2` is available).
+    - an `httpx.Client`: on the caller's client as-is, from worker threads.
+    Otherwise URLs are fetched sequentially with `fetch_json` on `client` (or
+    `get_default_session()`). Async callers should `await fetch_json_many_async(...)`.
+    """
+    if httpx is not None and isinstance(client, httpx.AsyncClient):
+        raise TypeError(
+            "fetch_json_many() needs a synchronous client; "
+            "use `await fetch_json_many_async(...)` with an httpx.AsyncClient."
+        )
+    url_list = list(urls)
+    concurrent = httpx is not None and not _has_running_loop()
+    if concurrent and client is None:
+        return asyncio.run(
+            _fetch_json_many_new_client(
+                urls=url_list, headers=headers, timeout_s=timeout_s, retry=retry, cache=cache
+            )
+        )
+    if concurrent and isinstance(client, httpx.Client):
+        return asyncio.run(
+            _fetch_json_many_threaded(
+                client=client,
+                urls=url_list,
+                headers=headers,
+                timeout_s=timeout_s,
+                retry=retry,
+                cache=cache,
+            )
+        )
+    session = client if client is not None else get_default_session()
+    return [
+        fetch_json(
+            session=session,
+            url=url,
+            headers=headers,
+            timeout_s=timeout_s,
+            retry=retry,
+            cache=cache,
+        )
+        for url in url_list
+    ]
+
+
+def fetch_json_default(
+    *,
+    url: str,
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    retry: RetryConfig,
+    cache: CacheConfig | None = None,
+) -> FetchJsonResult:
+    """`fetch_json` using the shared session from `get_default_session()`."""
+    return fetch_json(
+        session=get_default_session(),
+        url=url,
+        headers=headers,
+        timeout_s=timeout_s,
+        retry=retry,
+        cache=cache,
+    )
@@ -1,37 +1,104 @@
 from __future__ import annotations
 
+import itertools
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+_TMP_COUNTER = itertools.count()
+
 
 def load_json(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _serialize(obj: Any) -> bytes:
+    """Serialize `obj` to the canonical on-disk JSON bytes (sorted keys, trailing newline).
+
+    Shared by `dump_json` and `dump_json_atomic` so both write identical bytes, and always
+    uses the stdlib encoder so output doesn't depend on which optional packages are installed.
+    """
+    # Use 2-space indentation for human-friendly diffs in GitHub PRs.
+    return (json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+
+
 def dump_json(path: Path, obj: Any) -> None:
+    data = _serialize(obj)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        # Use 2-space indentation for human-friendly diffs in GitHub PRs.
-        json.dump(obj, f, indent=2, ensure_ascii=False, sort_keys=True)
-        f.write("\n")
+    path.write_bytes(data)
+
+
+def _file_matches(path: Path, payload: bytes) -> bool:
+    """Return True if `path` exists and its contents are exactly `payload`."""
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        return path.read_bytes() == payload
+    except OSError:
+        return False
+
+
+def _fsync_dir(path: Path) -> None:
+    """Best-effort fsync of a directory so a rename within it survives a crash."""
+    # Windows has no O_DIRECTORY and can't open directories this way.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        dfd = os.open(str(path), os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass
+    finally:
+        os.close(dfd)
+
+
+def _create_tmp(path: Path) -> tuple[Path, int]:
+    """Exclusively create a unique temp file next to `path` and return it with its fd.
+
+    The name combines the PID with a process-wide counter, and O_EXCL guarantees we never
+    reuse a file another writer (thread or process) is still using.
+    """
+    while True:
+        # `next()` on itertools.count is atomic under the GIL, so no lock is needed.
+        tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}.{next(_TMP_COUNTER)}")
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        return tmp, fd
 
 
-def dump_json_atomic(path: Path, obj: Any) -> None:
+def dump_json_atomic(path: Path, obj: Any, *, fsync: bool = True) -> None:
     """Write JSON to `path` atomically (best-effort).
 
     Writes to a temp file in the same directory and then replaces `path`, which
-    avoids leaving partially-written files on failure.
+    avoids leaving partially-written files on failure. Unless `fsync=False` (for disposable
+    data such as HTTP cache entries), the temp file and (where supported) the parent
+    directory are fsynced so the rename is durable across crashes.
+
+    Skips the write entirely when `path` already holds identical bytes, which avoids
+    spurious mtime changes and disk IO when regenerated output is unchanged.
     """
+    payload = _serialize(obj)
+    if _file_matches(path, payload):
+        return
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    tmp, fd = _create_tmp(path)
     try:
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=2, ensure_ascii=False, sort_keys=True)
-            f.write("\n")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         tmp.replace(path)
+        if fsync:
+            _fsync_dir(path.parent)
     finally:
         # If replace failed, try to clean up the temp file.
         try:
@@ -13,6 +13,7 @@ from _utils.enrichment_engine import (
     run_enrichment_engine,  # type: ignore[import-not-found]
 )
 from _utils.github_token import has_github_token  # type: ignore[import-not-found]
+from _utils.http import CacheConfig  # type: ignore[import-not-found]
 from _utils.io import dump_json_atomic, load_json  # type: ignore[import-not-found]
 from _utils.time import utc_now_iso  # type: ignore[import-not-found]
 
@@ -111,6 +112,14 @@ def main(argv: list[str]) -> int:
         default=25,
         help="Print progress every N processed components (default: 25). Use 0 to disable.",
     )
+    parser.add_argument(
+        "--github-cache-dir",
+        default=None,
+        help=(
+            "Directory for an ETag/Last-Modified cache of GitHub API responses. Unchanged "
+            "resources are revalidated with conditional requests (default: disabled)."
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -170,6 +179,10 @@ def main(argv: list[str]) -> int:
         "pypistats": pypistats_sleep,
     }
 
+    cache_by_service: dict[str, CacheConfig] = {}
+    if args.github_cache_dir:
+        cache_by_service["github"] = CacheConfig(dir=Path(args.github_cache_dir))
+
     run_fetched_at = utc_now_iso()
     comps_for_run = comps if args.limit is None else comps[: int(args.limit)]
     expected_counts: dict[str, int] = {e.name: 0 for e in enrichers}
@@ -196,6 +209,7 @@ def main(argv: list[str]) -> int:
         workers=int(args.workers),
         run_fetched_at=run_fetched_at,
         progress_every=(int(args.progress_every) if args.progress_every is not None else None),
+        cache_by_service=cache_by_service,
     )
     for enricher in enrichers:
         s = result.stats[enricher.name]